@@ -2,12 +2,12 @@ import hmac, hashlib
 import time
 import aiohttp, asyncio
 import logging
+import orjson
 
-from typing import Union
-from .logger import CustomLogger
+from typing import Optional, Union
+from .logger import get_logger
 
-logger_manager = CustomLogger()
-wfp_logger = logger_manager.get_logger("WayForPay", "logs/wfp.log", logging.ERROR)
+wfp_logger = get_logger("WayForPay", "logs/wfp.log", logging.ERROR)
 
 
 class SingletonMeta(type):
@@ -50,13 +50,56 @@ class WayForPayHandler(metaclass=SingletonMeta):
         if not hasattr(self, "initialized"):
             self.MERCHANT_ACCOUNT = merchant_account
             self.SECRET_KEY = secret_key
+            # Left as None without a secret so signing fails instead of using an empty key
+            self._secret_bytes = secret_key.encode() if secret_key else None
+            if self._secret_bytes is None:
+                wfp_logger.error("WayForPayHandler initialized without a secret key, requests cannot be signed")
             self.DOMAIN_NAME = domain_name
             self.payments = {}  # Stores payment data for each user
+            self._session: Optional[aiohttp.ClientSession] = None  # Created lazily inside the event loop
+            self._sem = asyncio.Semaphore(8)  # Caps concurrent requests to the WayForPay API
             asyncio.create_task(self.get_payment_data())
             self.initialized = True
         
 
-    async def generate_signature(self, data: str) -> str:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: A session with a pooled keep-alive connector.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60, ttl_dns_cache=300),
+                json_serialize=lambda value: orjson.dumps(value).decode()
+            )
+        return self._session
+
+    async def aclose(self):
+        """
+        Closes the shared HTTP session. Should be called on application shutdown.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _discard_payment(self, user_id: Union[int, str], payment: dict):
+        """
+        Removes a payment from the local cache, and the user entry once it is empty.
+
+        Args:
+            user_id (int | str): The user's unique identifier.
+            payment (dict): The payment dict to remove, matched by identity.
+        """
+        user_payments = self.payments.get(user_id)
+        if user_payments is None:
+            return
+        user_payments[:] = [p for p in user_payments if p is not payment]
+        if not user_payments:
+            del self.payments[user_id]
+
+    def generate_signature(self, data: str) -> str:
         """
         Generates an HMAC-MD5 signature for the given data using the secret key.
 
@@ -66,7 +109,7 @@ class WayForPayHandler(metaclass=SingletonMeta):
         Returns:
             str: The generated HMAC-MD5 signature.
         """
-        return hmac.new(self.SECRET_KEY.encode(), data.encode(), hashlib.md5).hexdigest()
+        return hmac.new(self._secret_bytes, data.encode(), hashlib.md5).hexdigest()
     
     async def create_invoice(self, user_id: Union[int, str], amount: int, product_type: str) -> dict:
         """
@@ -85,22 +128,15 @@ class WayForPayHandler(metaclass=SingletonMeta):
         product_name = product_type
 
         create_invoice_signature_data = f"{self.MERCHANT_ACCOUNT};{self.DOMAIN_NAME};{order_reference};{order_date};{amount};UAH;{product_name};1;{amount}"
-        signature = await self.generate_signature(create_invoice_signature_data)
+        signature = self.generate_signature(create_invoice_signature_data)
         
-        try:
-            user_info = self.payments.get(user_id)
-            if not user_info:
-                self.payments[user_id] = []
-        except Exception as e:
-            wfp_logger.error(f"Error in WayForPayHandler.create_invoice: {e}\nself.payments in user_id: {user_id} -> {self.payments[user_id]}")
-        try:
-            self.payments[user_id].append({
-                "order_reference": order_reference,
-                "product_type": product_type,
-                "order_date": order_date
-            })
-        except Exception as e:
-            wfp_logger.error(f"Error in WayForPayHandler.create_invoice: {e}\nself.payments in user_id: {user_id} -> {self.payments[user_id]}")
+        payment = {
+            "order_reference": order_reference,
+            "product_type": product_type,
+            "order_date": order_date,
+            "event": asyncio.Event()  # Set by get_payment_data once payment_status is known
+        }
+        self.payments.setdefault(user_id, []).append(payment)
 
         invoice_data = {
             "transactionType": "CREATE_INVOICE",
@@ -118,16 +154,21 @@ class WayForPayHandler(metaclass=SingletonMeta):
             "merchantSignature": signature
         }
 
+        result = None
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            async with self._sem:
                 async with session.post("https://api.wayforpay.com/api", json=invoice_data) as responce:
-                    result = await responce.json()
-                    if result.get("invoiceUrl"):
-                        return {"invoice_url": result["invoiceUrl"], "qr_code": result["qrCode"]}
-                    else:
-                        return {"error": "error"}
+                    result = orjson.loads(await responce.read())
+            if result.get("invoiceUrl"):
+                return {"invoice_url": result["invoiceUrl"], "qr_code": result["qrCode"]}
+            else:
+                self._discard_payment(user_id, payment)
+                return {"error": "error"}
         except Exception as e:
-            wfp_logger.error(f"Error in WayForPayHandler.create_invoice in post for user_id {user_id}: {e} -> {result}")
+            # No invoice exists, so nothing will ever complete this payment
+            self._discard_payment(user_id, payment)
+            wfp_logger.error("Error in WayForPayHandler.create_invoice in post for user_id %s: %s -> %s", user_id, e, result)
 
                 
     async def get_payment_data(self):
@@ -141,49 +182,61 @@ class WayForPayHandler(metaclass=SingletonMeta):
                     await asyncio.sleep(5)
                     continue
             except Exception as e:
-                wfp_logger.error(f"Error in WayForPayHandler.get_payment_data start: {e}")
+                wfp_logger.error("Error in WayForPayHandler.get_payment_data start: %s", e)
 
             date_end = int(time.time())
+            request_data = None
+            result = None
 
-            for user_id in list(self.payments.keys()):
-                try:
-                    payments = self.payments[user_id]
-                    for payment in payments:
-                        order_reference = payment["order_reference"]
-                        date_begin = payment["order_date"]
-
-                        get_payment_signature_data = f"{self.MERCHANT_ACCOUNT};{date_begin-1000};{date_end}"
-                        signature = await self.generate_signature(get_payment_signature_data)
-
-                        request_data = {
-                            "apiVersion": 1,
-                            "transactionType": "TRANSACTION_LIST",
-                            "merchantAccount": self.MERCHANT_ACCOUNT,
-                            "merchantSignature": signature,
-                            "dateBegin": date_begin - 1000,
-                            "dateEnd": date_end,
-                        }
-
-                        async with aiohttp.ClientSession() as session:
-                            async with session.post(
-                                "https://api.wayforpay.com/api", json=request_data
-                            ) as response:
-                                result = await response.json()
-
-                                transaction_list = result.get("transactionList", [])
-
-                                for transaction in transaction_list:
-                                    if transaction.get("orderReference") == order_reference:
-                                        transaction_status = transaction.get("transactionStatus")
-                                        logging.info(f"transaction_status: {transaction_status}")
-                                        if transaction_status in ["Approved", "Declined", "Expired"]:
-                                            payment["payment_status"] = transaction_status
-
-                    if not payments:
-                        del self.payments[user_id]
-
-                except Exception as e:
-                    wfp_logger.error(f"Error in WayForPayHandler.get_payment_data after: {e}\n\norder_reference: {order_reference}\ndate_begin: {date_begin}\nrequest_data: {request_data}\nresult: {result}")
+            try:
+                # Payments with a final status only wait for check_payment_data to collect them
+                pending = [
+                    payment for payments in self.payments.values() for payment in payments
+                    if "payment_status" not in payment
+                ]
+                if pending:
+                    # One merchant-wide request per tick covering the oldest pending order
+                    date_begin = min(payment["order_date"] for payment in pending) - 1000
+
+                    get_payment_signature_data = f"{self.MERCHANT_ACCOUNT};{date_begin};{date_end}"
+                    signature = self.generate_signature(get_payment_signature_data)
+
+                    request_data = {
+                        "apiVersion": 1,
+                        "transactionType": "TRANSACTION_LIST",
+                        "merchantAccount": self.MERCHANT_ACCOUNT,
+                        "merchantSignature": signature,
+                        "dateBegin": date_begin,
+                        "dateEnd": date_end,
+                    }
+
+                    session = await self._get_session()
+                    async with self._sem:
+                        async with session.post(
+                            "https://api.wayforpay.com/api", json=request_data
+                        ) as response:
+                            result = orjson.loads(await response.read())
+
+                    by_ref = {
+                        transaction.get("orderReference"): transaction
+                        for transaction in result.get("transactionList", [])
+                    }
+
+                    for payment in pending:
+                        transaction = by_ref.get(payment["order_reference"])
+                        if transaction is None:
+                            continue
+                        transaction_status = transaction.get("transactionStatus")
+                        logging.info("transaction_status: %s", transaction_status)
+                        if transaction_status in ["Approved", "Declined", "Expired"]:
+                            payment["payment_status"] = transaction_status
+                            payment["event"].set()
+
+                for user_id in [user_id for user_id, payments in self.payments.items() if not payments]:
+                    del self.payments[user_id]
+
+            except Exception as e:
+                wfp_logger.error("Error in WayForPayHandler.get_payment_data after: %s\n\nrequest_data: %s\nresult: %s", e, request_data, result)
 
             await asyncio.sleep(15)
 
@@ -206,63 +259,56 @@ class WayForPayHandler(metaclass=SingletonMeta):
         user_payments = self.payments.get(user_id, [])
 
         target_dict = None
-        target_index = None
 
         try:
-            user_payments[:] = [
-                payment for i, payment in enumerate(user_payments)
-                if not (payment.get("product_type") == product_type and target_dict is not None)
-            ]
-            for i, payment in enumerate(user_payments):
-                if payment.get("product_type") == product_type and target_dict is None:
-                    target_dict = payment
-                    target_index = i
+            target_dict = next(
+                (payment for payment in user_payments if payment.get("product_type") == product_type),
+                None
+            )
         except Exception as e:
             wfp_logger.error(
-                f"Error in check_payment_data: {e}, user_id: {user_id}, "
-                f"product_type: {product_type}, target_dict: {target_dict}, user_payments: {user_payments}"
+                "Error in check_payment_data: %s, user_id: %s, product_type: %s, target_dict: %s, user_payments: %d entries",
+                e, user_id, product_type, target_dict, len(user_payments)
             )
             raise RuntimeError(
                 f"Unexpected error in check_payment_data: {e}, user_id: {user_id}, product_type: {product_type}"
             ) from e
 
         if target_dict is None:
-            wfp_logger.warning(f"No transaction found for user {user_id} with product_type {product_type}")
+            wfp_logger.warning("No transaction found for user %s with product_type %s", user_id, product_type)
             raise ValueError("Transaction with the specified product_type not found.")
 
         timeout = 60 * 20
-        start_time = time.time()
 
-        while True:
-            try:
-                if "payment_status" in target_dict:
-                    status = target_dict["payment_status"]
+        try:
+            await asyncio.wait_for(target_dict["event"].wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # Drop the expired payment so get_payment_data stops polling for it
+            self._discard_payment(user_id, target_dict)
 
-                    if target_index is not None:
-                        user_payments.pop(target_index)
-                    if not user_payments and user_id in self.payments:
-                        del self.payments[user_id]
+            wfp_logger.warning(
+                "Timeout while waiting for transaction completion for user %s, product_type: %s", user_id, product_type
+            )
+            raise TimeoutError("Transaction status update timed out.")
 
-                    wfp_logger.info(
-                        f"Transaction completed for user {user_id}, status: {status}, product_type: {product_type}"
-                    )
-                    return user_id, status
+        try:
+            status = target_dict["payment_status"]
 
-            except KeyError as e:
-                wfp_logger.error(f"Error in payment dictionary structure: {e}, target_dict: {target_dict}")
-                raise
+            # Other waiters may have changed the list meanwhile, so remove by identity rather than index
+            self._discard_payment(user_id, target_dict)
 
-            except Exception as e:
-                wfp_logger.error(
-                    f"Unexpected error in check_payment_data: {e}, user_id: {user_id}, "
-                    f"product_type: {product_type}, target_dict: {target_dict}"
-                )
-                raise
-
-            if time.time() - start_time > timeout:
-                wfp_logger.warning(
-                    f"Timeout while waiting for transaction completion for user {user_id}, product_type: {product_type}"
-                )
-                raise TimeoutError("Transaction status update timed out.")
-
-            await asyncio.sleep(5)
+            wfp_logger.info(
+                "Transaction completed for user %s, status: %s, product_type: %s", user_id, status, product_type
+            )
+            return user_id, status
+
+        except KeyError as e:
+            wfp_logger.error("Error in payment dictionary structure: %s, target_dict: %s", e, target_dict)
+            raise
+
+        except Exception as e:
+            wfp_logger.error(
+                "Unexpected error in check_payment_data: %s, user_id: %s, product_type: %s, target_dict: %s",
+                e, user_id, product_type, target_dict
+            )
+            raise
@@ -1,9 +1,18 @@
+import asyncio
+import functools
+import logging
+
 from aiogram import types
-from io import BytesIO
 
 import cloudinary
 import cloudinary.uploader
 from cloudinary.utils import cloudinary_url
+from .logger import get_logger
+
+photo_logger = get_logger("PhotoHandler", "logs/photo.log", logging.WARNING)
+
+# Credentials are loaded by the SDK itself from CLOUDINARY_URL or the CLOUDINARY_* environment variables
+cloudinary.config(secure=True)
 
 
 async def cloudinary_upload(byteio_content, name):
@@ -17,14 +26,10 @@ async def cloudinary_upload(byteio_content, name):
     Returns:
         dict: The upload result, including the URL of the uploaded image, or None in case of an error.
     """
-    cloudinary.config(
-        cloud_name="********",  # Your Cloudinary account name
-        api_key="********",  # Cloudinary API key
-        api_secret="********",  # Cloudinary API secret key
-        secure=True
+    # The Cloudinary SDK is blocking, so run the upload in the default executor
+    result = await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(cloudinary.uploader.upload, file=byteio_content, public_id=name)
     )
-
-    result = cloudinary.uploader.upload(file=byteio_content, public_id=name)
     return result
 
 
@@ -51,8 +56,9 @@ async def photo_handler(message: types.Message):
     # Download the file content
     file_content = await message.bot.download_file(file_path)
 
-    # Convert the file content to BytesIO
-    byteio_content = BytesIO(file_content.read())
+    # download_file already returns a BytesIO, so rewind and reuse it instead of copying
+    file_content.seek(0)
+    byteio_content = file_content
     
     # Use the user's ID as the file name
     name = message.from_user.id
@@ -60,4 +66,4 @@ async def photo_handler(message: types.Message):
     if telegraph_link:
         return telegraph_link.get("url")
     else:
-        print("Failed to upload to Telegraph.")
+        photo_logger.warning("Failed to upload to Telegraph.")
@@ -1,12 +1,20 @@
 import time
+import asyncio
 from aiogram import Bot
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.utils.exceptions import RetryAfter
 from database import db
-from utils.logger import CustomLogger
+from utils.logger import get_logger
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-logger_manager = CustomLogger()
-subscription_logger = logger_manager.get_logger("SubscriptionControl", "logs/subscription_control.log", level="INFO")
+subscription_logger = get_logger("SubscriptionControl", "logs/subscription_control.log", level="INFO")
+
+# Reminder keyboards never change, so build them once
+_PRE_KB = InlineKeyboardMarkup().add(
+    InlineKeyboardButton(text="Продовжити", callback_data="sub_pre_plus"),
+    InlineKeyboardButton(text="Відмінити", callback_data="sub_pre_off")
+)
+_REMINDER_KB = InlineKeyboardMarkup().add(InlineKeyboardButton(text="Поновити", callback_data="to_payment"))
 
 
 class SubscriptionControl:
@@ -19,6 +27,7 @@ class SubscriptionControl:
     """
 
     scheduler = AsyncIOScheduler()
+    api_interval = 1 / 25  # Minimum spacing between Telegram API calls, keeps us under ~30 requests per second
 
     def __init__(self, bot: Bot) -> None:
         """
@@ -28,9 +37,34 @@ class SubscriptionControl:
             bot (Bot): Telegram Bot instance.
         """
         self.bot = bot
+        self._api_lock = asyncio.Lock()
+        self._next_api_call = 0.0
         self.scheduler.add_job(self.subscription_checker, 'interval', hours=6)
         self.scheduler.start()
 
+    async def _throttle(self):
+        """
+        Waits until the next Telegram API call is allowed by api_interval.
+        """
+        async with self._api_lock:
+            now = time.monotonic()
+            if self._next_api_call > now:
+                await asyncio.sleep(self._next_api_call - now)
+            self._next_api_call = max(now, self._next_api_call) + self.api_interval
+
+    async def _send_message(self, **kwargs):
+        """
+        Sends a message through the throttle, retrying once if Telegram asks to wait (flood control).
+        """
+        await self._throttle()
+        try:
+            await self.bot.send_message(**kwargs)
+        except RetryAfter as e:
+            subscription_logger.warning(f"Flood control for chat {kwargs.get('chat_id')}, retrying in {e.timeout}s.")
+            await asyncio.sleep(e.timeout)
+            await self._throttle()
+            await self.bot.send_message(**kwargs)
+
     async def subscription_checker(self):
         """
         Checks subscription statuses and performs necessary actions, such as sending reminders or removing users.
@@ -40,19 +74,28 @@ class SubscriptionControl:
             timestamp = int(time.time())
             subscribers = await db.get_subscribers()
 
-            if subscribers:
-                for user_id, end_time, is_pre_reminded, is_stopped in subscribers:
-                    try:
-                        diff_time = int(end_time) - timestamp
+            # Bounds how many users are handled at once; the request rate itself is limited by _throttle
+            sem = asyncio.Semaphore(25)
+
+            async def _handle_sub(row, channel_id):
+                user_id, end_time, is_pre_reminded, is_stopped = row
+                try:
+                    diff_time = int(end_time) - timestamp
 
+                    async with sem:
                         if not is_pre_reminded and diff_time <= 24 * 60 * 60:
                             await self.payment_pre_reminder(user_id)
                         elif is_pre_reminded and timestamp >= int(end_time):
-                            await self.payment_reminder(user_id)
+                            await self.payment_reminder(user_id, channel_id)
                         elif is_stopped and timestamp >= int(end_time):
-                            await self.delete_user(user_id)
-                    except Exception as user_exception:
-                        subscription_logger.error(f"Error processing subscription for user {user_id}: {user_exception}")
+                            await self.delete_user(user_id, channel_id)
+                except Exception as user_exception:
+                    subscription_logger.error(f"Error processing subscription for user {user_id}: {user_exception}")
+
+            if subscribers:
+                # The channel is the same for every subscriber, fetch it once per run
+                channel_id = await db.get_channel_id()
+                await asyncio.gather(*[_handle_sub(row, channel_id) for row in subscribers], return_exceptions=True)
 
         except Exception as e:
             subscription_logger.error(f"Error in subscription_checker: {e}")
@@ -70,25 +113,20 @@ class SubscriptionControl:
             "Нижче ти можешь продовжити підписку, або ж відмовитись від неї"
         )
 
-        keyboard = InlineKeyboardMarkup()
-        keyboard.add(
-            InlineKeyboardButton(text="Продовжити", callback_data=f"sub_pre_plus"),
-            InlineKeyboardButton(text="Відмінити", callback_data=f"sub_pre_off")
-        )
-
         try:
-            await self.bot.send_message(chat_id=user_id, text=text, reply_markup=keyboard, parse_mode="HTML")
+            await self._send_message(chat_id=user_id, text=text, reply_markup=_PRE_KB, parse_mode="HTML")
             subscription_logger.info(f"Pre-reminder sent to user {user_id}.")
             await db.set_pre_reminded(user_id)
         except Exception as e:
             subscription_logger.error(f"Error sending pre-reminder to user {user_id}: {e}")
 
-    async def payment_reminder(self, user_id: int):
+    async def payment_reminder(self, user_id: int, channel_id: int):
         """
         Notifies the user that their subscription has expired and removes them from the channel.
 
         Args:
             user_id (int): Telegram user ID.
+            channel_id (int): ID of the subscription channel.
         """
         text = (
             "Привіт!\n\n"
@@ -96,18 +134,16 @@ class SubscriptionControl:
             "Ти завжди можешь повернутись до нас натиснувши кнопку нижче"
         )
 
-        keyboard = InlineKeyboardMarkup()
-        keyboard.add(InlineKeyboardButton(text="Поновити", callback_data="to_payment"))
-
         try:
-            await self.bot.send_message(chat_id=user_id, text=text, reply_markup=keyboard, parse_mode="HTML")
+            await self._send_message(chat_id=user_id, text=text, reply_markup=_REMINDER_KB, parse_mode="HTML")
             subscription_logger.info(f"Payment reminder sent to user {user_id}.")
         except Exception as e:
             subscription_logger.error(f"Error sending payment reminder to user {user_id}: {e}")
 
-        channel_id = await db.get_channel_id()
         try:
+            await self._throttle()
             await self.bot.ban_chat_member(chat_id=channel_id, user_id=user_id)
+            await self._throttle()
             await self.bot.unban_chat_member(chat_id=channel_id, user_id=user_id)
             subscription_logger.info(f"User {user_id} temporarily banned and unbanned in channel {channel_id}.")
         except Exception as e:
@@ -115,15 +151,16 @@ class SubscriptionControl:
 
         await db.update_status(user_id)
 
-    async def delete_user(self, user_id: int):
+    async def delete_user(self, user_id: int, channel_id: int):
         """
         Permanently removes a user from the channel after subscription expiration.
 
         Args:
             user_id (int): Telegram user ID.
+            channel_id (int): ID of the subscription channel.
         """
-        channel_id = await db.get_channel_id()
         try:
+            await self._throttle()
             await self.bot.ban_chat_member(chat_id=channel_id, user_id=user_id, until_date=int(time.time()) + 15)
             subscription_logger.info(f"User {user_id} banned from channel {channel_id}.")
         except Exception as e:
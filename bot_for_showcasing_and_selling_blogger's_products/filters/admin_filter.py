@@ -1,12 +1,21 @@
 # Message distribution filter for admins
 
+import time
+
 from aiogram.types import Message
 from aiogram.dispatcher.filters import BoundFilter
 from database import db
 
 
 class IsAdmin(BoundFilter):
+    # Admin IDs and the monotonic time they were fetched, shared by all instances
+    _cache: tuple[frozenset[int], float] | None = None
+    _ttl = 30.0
+
     async def check(self, message: Message):
-        admins_list = await db.is_admin()
+        now = time.monotonic()
+        if IsAdmin._cache is None or now - IsAdmin._cache[1] > self._ttl:
+            admins = frozenset(await db.is_admin())
+            IsAdmin._cache = (admins, now)
 
-        return int(message.from_user.id) in admins_list
+        return int(message.from_user.id) in IsAdmin._cache[0]
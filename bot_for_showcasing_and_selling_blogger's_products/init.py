@@ -9,6 +9,7 @@ from aiogram.types import Update
 from database import db
 from handlers.admin import admin
 from handlers.user import user
+from utils import telepraph
 
 logging.basicConfig(level=logging.INFO)
 
@@ -57,7 +58,10 @@ async def startup():
 
 
 async def main():
-    await startup()
+    try:
+        await startup()
+    finally:
+        await telepraph.close_session()
 
 
 if __name__ == '__main__':
@@ -2,24 +2,40 @@
 # Accepts only photos and returns the file link (or None).
 
 import aiohttp
-import json
+import orjson
 from aiogram import types
 from aiohttp.formdata import FormData
 from io import BytesIO
 
+# Shared between uploads so connections to telegra.ph are reused; created lazily inside the event loop
+_session = None
+
+
+async def _get_session():
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+    return _session
 
-async def telegraph_byteio_upload(byteio_content):
-    file_content = byteio_content.getvalue()
 
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def telegraph_byteio_upload(byteio_content):
     url = 'https://telegra.ph/upload'
     data = FormData()
-    data.add_field('file', file_content, filename='file', content_type='image/png')
+    # aiohttp streams file-like objects, so the BytesIO is passed as is instead of copying its bytes
+    data.add_field('file', byteio_content, filename='file', content_type='image/png')
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, data=data) as response:
-            result = await response.text()
+    session = await _get_session()
+    async with session.post(url, data=data) as response:
+        result = await response.text()
             
-    response_json = json.loads(result)
+    response_json = orjson.loads(result)
     
     if isinstance(response_json, list) and len(response_json) > 0 and 'src' in response_json[0]:
         telegraph_url = response_json[0]['src']